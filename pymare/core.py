@@ -86,9 +86,14 @@ class Dataset:
             if (n is not None) or ("n" in data.columns):
                 n = data.loc[:, n or "n"].values
 
-        self.y = ensure_2d(y)
-        self.v = ensure_2d(v)
-        self.n = ensure_2d(n)
+        # Store in Fortran (column-major) order, so that per-dataset column
+        # slices are contiguous and can be handed to BLAS/LAPACK routines
+        # without intermediate copies.
+        self.y = np.asfortranarray(ensure_2d(y))
+        v = ensure_2d(v)
+        self.v = np.asfortranarray(v) if v is not None else None
+        n = ensure_2d(n)
+        self.n = np.asfortranarray(n) if n is not None else None
         X, names = self._get_predictors(X, X_names, add_intercept)
         self.X = X
         self.X_names = names
@@ -1,13 +1,14 @@
 """Tools for representing and manipulating meta-regression results."""
 
 import itertools
+import math
 from functools import lru_cache
 from inspect import getfullargspec
-from warnings import warn
 
 import numpy as np
 import pandas as pd
 import scipy.stats as ss
+from scipy.special import ndtr, ndtri
 
 try:
     import arviz as az
@@ -17,6 +18,16 @@ except ImportError:
 from pymare.stats import q_gen, q_profile
 
 
+@lru_cache(maxsize=32)
+def _norm_ppf(q):
+    """Memoize the scalar normal quantile.
+
+    scipy.stats.norm dispatch is relatively expensive, and the alpha values
+    passed to the results methods rarely vary across calls.
+    """
+    return ss.norm.ppf(q)
+
+
 class MetaRegressionResults:
     """Container for results generated by PyMARE meta-regression estimators.
 
@@ -50,17 +61,30 @@ class MetaRegressionResults:
         self.fe_cov = fe_cov
         self.tau2 = tau2
 
+        # Instance-level stat caches. lru_cache on methods would hold a
+        # strong reference to self, keeping the Dataset/estimator alive after
+        # the results object is dropped; it also misses on float-noise
+        # differences in alpha, which the rounded keys absorb.
+        self._fe_stats_cache = {}
+        self._re_stats_cache = {}
+        self._het_stats = None
+
     @property
-    @lru_cache(maxsize=1)
     def fe_se(self):
         """Get fixed-effect standard error."""
-        cov = self.fe_cov.copy()
+        cov = self.fe_cov
         if cov.ndim == 2:
-            cov = cov[None, :, :]
+            # A 2-d fe_cov comes from the loopable estimators' squeeze step
+            # and holds one variance per dataset in a (1, d) row (the fits
+            # are intercept-only), so the SEs are the element-wise roots.
+            return np.sqrt(cov)
 
-        return np.sqrt(np.diagonal(cov)).T
+        # Gather the (p, d) diagonal directly; copying into a 3-d array and
+        # calling np.diagonal on it would traverse memory twice and return a
+        # non-contiguous view.
+        idx = np.arange(cov.shape[0])
+        return np.sqrt(cov[idx, idx])
 
-    @lru_cache(maxsize=16)
     def get_fe_stats(self, alpha=0.05):
         """Get fixed-effect statistics.
 
@@ -83,8 +107,12 @@ class MetaRegressionResults:
             ci_l/ci_u   Lower and upper bounds of the estimate.
             =========== ==========================================================================
         """
+        key = round(alpha, 9)
+        if key in self._fe_stats_cache:
+            return self._fe_stats_cache[key]
+
         beta, se = self.fe_params, self.fe_se
-        z_se = ss.norm.ppf(1 - alpha / 2)
+        z_se = _norm_ppf(1 - alpha / 2)
         z = beta / se
 
         stats = {
@@ -93,12 +121,14 @@ class MetaRegressionResults:
             "ci_l": beta - z_se * se,
             "ci_u": beta + z_se * se,
             "z": z,
-            "p": 1 - np.abs(0.5 - ss.norm.cdf(z)) * 2,
+            # ndtr is the ufunc underlying ss.norm.cdf/sf; calling it
+            # directly skips the frozen-distribution dispatch layer
+            "p": 2 * ndtr(-np.abs(z)),
         }
 
+        self._fe_stats_cache[key] = stats
         return stats
 
-    @lru_cache(maxsize=16)
     def get_re_stats(self, method="QP", alpha=0.05):
         """Get random-effect statistics.
 
@@ -133,45 +163,39 @@ class MetaRegressionResults:
         if self.dataset is None:
             raise ValueError("The Dataset is unavailable. This method requires a Dataset.")
 
+        key = (method, round(alpha, 9))
+        if key in self._re_stats_cache:
+            return self._re_stats_cache[key]
+
         if method == "QP":
             n_datasets = np.atleast_2d(self.tau2).shape[1]
-            if n_datasets > 10:
-                warn(
-                    "Method 'QP' is not parallelized; it may take a while to "
-                    f"compute CIs for {n_datasets} parallel tau^2 values."
-                )
 
             # Make sure we have an estimate of v if it wasn't observed
             v = self.estimator.get_v(self.dataset)
 
-            cis = []
-            for i in range(n_datasets):
-                args = {
-                    "y": self.dataset.y[:, i],
-                    "v": v[:, i],
-                    "X": self.dataset.X,
-                    "alpha": alpha,
-                }
-
-                try:
-                    q_cis = q_profile(**args)
-                except Exception:
-                    q_cis = {"ci_l": np.nan, "ci_u": np.nan}
-
-                cis.append(q_cis)
+            # q_profile computes the CIs for all parallel datasets at once
+            try:
+                q_cis = q_profile(y=self.dataset.y, v=v, X=self.dataset.X, alpha=alpha)
+                ci_l = np.atleast_1d(q_cis["ci_l"])
+                ci_u = np.atleast_1d(q_cis["ci_u"])
+            except Exception:
+                ci_l = np.full(n_datasets, np.nan)
+                ci_u = np.full(n_datasets, np.nan)
 
         else:
             raise ValueError(
                 "Invalid CI method '{}'; currently only 'QP' is available.".format(method)
             )
 
-        return {
+        stats = {
             "tau^2": self.tau2,
-            "ci_l": np.array([ci["ci_l"] for ci in cis]),
-            "ci_u": np.array([ci["ci_u"] for ci in cis]),
+            "ci_l": ci_l,
+            "ci_u": ci_u,
         }
 
-    @lru_cache(maxsize=16)
+        self._re_stats_cache[key] = stats
+        return stats
+
     def get_heterogeneity_stats(self):
         """Get heterogeneity statistics.
 
@@ -206,13 +230,16 @@ class MetaRegressionResults:
         if self.dataset is None:
             raise ValueError("The Dataset is unavailable. This method requires a Dataset.")
 
-        v = self.estimator.get_v(self.dataset)
-        q_fe = q_gen(self.dataset.y, v, self.dataset.X, 0)
-        df = self.dataset.y.shape[0] - self.dataset.X.shape[1]
-        i2 = np.maximum(100.0 * (q_fe - df) / q_fe, 0.0)
-        h = np.maximum(np.sqrt(q_fe / df), 1.0)
-        p = ss.chi2.sf(q_fe, df)
-        return {"Q": q_fe, "p(Q)": p, "I^2": i2, "H": h}
+        if self._het_stats is None:
+            v = self.estimator.get_v(self.dataset)
+            q_fe = q_gen(self.dataset.y, v, self.dataset.X, 0)
+            df = self.dataset.y.shape[0] - self.dataset.X.shape[1]
+            i2 = np.maximum(100.0 * (q_fe - df) / q_fe, 0.0)
+            h = np.maximum(np.sqrt(q_fe / df), 1.0)
+            p = ss.chi2.sf(q_fe, df)
+            self._het_stats = {"Q": q_fe, "p(Q)": p, "I^2": i2, "H": h}
+
+        return self._het_stats
 
     def to_df(self, alpha=0.05):
         """Return a pandas DataFrame summarizing fixed effect results.
@@ -259,16 +286,26 @@ class MetaRegressionResults:
                 "results at the moment."
             )
 
-        fe_stats = self.get_fe_stats(alpha).items()
-        df = pd.DataFrame({k: v.ravel() for k, v in fe_stats})
-        df["name"] = self.dataset.X_names
-        df = df.loc[:, ["name", "est", "se", "z", "p", "ci_l", "ci_u"]]
+        # get_fe_stats caches on alpha, so repeated to_df calls (e.g., from
+        # permutation test summaries) don't recompute the statistics. Build
+        # the DataFrame directly in its final column order rather than
+        # creating, reindexing, and renaming an intermediate frame.
+        fe_stats = self.get_fe_stats(alpha)
         ci_l = "ci_{:.6g}".format(alpha / 2)
         ci_u = "ci_{:.6g}".format(1 - alpha / 2)
-        df.columns = ["name", "estimate", "se", "z-score", "p-value", ci_l, ci_u]
-        return df
-
-    def permutation_test(self, n_perm=1000):
+        return pd.DataFrame(
+            {
+                "name": self.dataset.X_names,
+                "estimate": fe_stats["est"].ravel(),
+                "se": fe_stats["se"].ravel(),
+                "z-score": fe_stats["z"].ravel(),
+                "p-value": fe_stats["p"].ravel(),
+                ci_l: fe_stats["ci_l"].ravel(),
+                ci_u: fe_stats["ci_u"].ravel(),
+            }
+        )
+
+    def permutation_test(self, n_perm=1000, rng=None):
         """Run permutation test.
 
         .. warning::
@@ -282,6 +319,9 @@ class MetaRegressionResults:
             Number of permutations to generate. The actual number used may be smaller in the event
             of an exact test (see below), but will never be larger.
             Default = 1000.
+        rng : None, :obj:`int`, or :obj:`numpy.random.Generator`, optional
+            Seed or Generator used to produce the permutations; passed to
+            :func:`numpy.random.default_rng`. Default = None.
 
         Returns
         -------
@@ -294,6 +334,8 @@ class MetaRegressionResults:
         conducted.
         Otherwise an approximate test will be conducted by randomly shuffling the outcomes n_perm
         times (or, for intercept-only models, by randomly flipping their signs).
+        In both cases, each permutation reorders ``y`` and ``v`` (or ``n``) jointly, so the
+        study-level pairing of estimates and variances is preserved.
         Note that for closed-form estimators (e.g., 'DL' and 'HE'), permuted datasets are
         estimated in parallel.
         This means that one can often set very high n_perm values (e.g., 100k) with little
@@ -302,6 +344,8 @@ class MetaRegressionResults:
         if self.dataset is None:
             raise ValueError("The Dataset is unavailable. This method requires a Dataset.")
 
+        rng = np.random.default_rng(rng)
+
         n_obs, n_datasets = self.dataset.y.shape
         has_mods = self.dataset.X.shape[1] > 1
 
@@ -313,14 +357,11 @@ class MetaRegressionResults:
         if not isinstance(tau2, (list, tuple, np.ndarray)):
             tau2 = np.full(n_datasets, tau2)
 
-        # create results arrays
-        fe_p = np.zeros_like(self.fe_params)
         rfx = self.tau2 is not None
-        tau_p = np.zeros((n_datasets,)) if rfx else None
 
         # Calculate # of permutations and determine whether to use exact test
         if has_mods:
-            n_exact = np.math.factorial(n_obs)
+            n_exact = math.factorial(n_obs)
         else:
             n_exact = 2**n_obs
             if n_exact < n_perm:
@@ -330,47 +371,76 @@ class MetaRegressionResults:
         if exact:
             n_perm = n_exact
 
-        # Loop over parallel datasets
-        for i in range(n_datasets):
-            y = self.dataset.y[:, i]
-            y_perm = np.repeat(y[:, None], n_perm, axis=1)
-
-            # for v, we might actually be working with n, depending on estimator
-            has_v = "v" in getfullargspec(self.estimator.fit).args[1:]
-            v = self.dataset.v[:, i] if has_v else self.dataset.n[:, i]
+        # for v, we might actually be working with n, depending on estimator
+        has_v = "v" in getfullargspec(self.estimator.fit).args[1:]
+        v_all = self.dataset.v if has_v else self.dataset.n
 
-            v_perm = np.repeat(v[:, None], n_perm, axis=1)
+        # The permutation structure is dataset-independent, so it is generated
+        # once and shared across all parallel datasets.
+        if has_mods:
+            if exact:
+                # All n_obs! permutations as one index array; the exact test
+                # only triggers when n_obs is small, so this stays cheap.
+                idx = np.array(list(itertools.permutations(range(n_obs))), dtype=np.intp).T
+            else:
+                # One random permutation per column. A single argsort call
+                # replaces n_perm Python-level shuffles, and applying the
+                # same index array to y and v preserves the (y_i, v_i)
+                # pairing.
+                idx = np.argsort(rng.random((n_obs, n_perm)), axis=0)
+        elif not exact:
+            # int8 storage keeps the sign matrix 8x smaller than the
+            # default integer dtype, helping cache residency.
+            signs = rng.integers(0, 2, size=(n_obs, n_perm), dtype=np.int8) * 2 - 1
+
+        # Stack the permuted versions of all parallel datasets into a single
+        # batch (one block of n_perm columns per dataset), so the estimator is
+        # fitted only once; closed-form estimators vectorize over the columns.
+        if n_datasets == 1:
+            y = self.dataset.y[:, 0]
+            v = v_all[:, 0]
 
             if has_mods:
-                if exact:
-                    perms = itertools.permutations(range(n_obs))
-                    for j, inds in enumerate(perms):
-                        inds = np.array(inds)
-                        y_perm[:, j] = y[inds]
-                        v_perm[:, j] = v[inds]
-                else:
-                    for j in range(n_perm):
-                        np.random.shuffle(y_perm[:, j])
-                        np.random.shuffle(v_perm[:, j])
+                y_big = y[idx]
+                v_big = v[idx]
             else:
-                if exact:
-                    y_perm *= perms
+                # Sign flips leave the variances untouched, so v never needs
+                # to be materialized: a zero-copy broadcast view suffices.
+                y_big = y[:, None] * (perms if exact else signs)
+                v_big = np.broadcast_to(v[:, None], (n_obs, n_perm))
+        else:
+            # Allocate column-major so each permutation's column is contiguous
+            y_big = np.empty((n_obs, n_datasets * n_perm), order="F")
+            v_big = np.empty((n_obs, n_datasets * n_perm), order="F")
+
+            for i in range(n_datasets):
+                cols = slice(i * n_perm, (i + 1) * n_perm)
+                y = self.dataset.y[:, i]
+                v = v_all[:, i]
+
+                if has_mods:
+                    y_big[:, cols] = y[idx]
+                    v_big[:, cols] = v[idx]
                 else:
-                    signs = np.random.choice(np.array([-1, 1]), (n_obs, n_perm))
-                    y_perm *= signs
-
-            # Pass parameters, remembering that v may actually be n
-            kwargs = {"y": y_perm, "X": self.dataset.X}
-            kwargs["v" if has_v else "n"] = v_perm
-            params = self.estimator.fit(**kwargs).params_
-
-            fe_obs = fe_stats["est"][:, i]
-            if fe_obs.ndim == 1:
-                fe_obs = fe_obs[:, None]
-            fe_p[:, i] = (np.abs(fe_obs) < np.abs(params["fe_params"])).mean(1)
-            if rfx:
-                abs_obs = np.abs(tau2[i])
-                tau_p[i] = (abs_obs < np.abs(params["tau2"])).mean()
+                    # Write the products straight into the batch buffer and
+                    # broadcast v into its block; no intermediate (n_obs,
+                    # n_perm) temporaries.
+                    np.multiply(y[:, None], perms if exact else signs, out=y_big[:, cols])
+                    v_big[:, cols] = v[:, None]
+
+        # Pass parameters, remembering that v may actually be n
+        kwargs = {"y": y_big, "X": self.dataset.X}
+        kwargs["v" if has_v else "n"] = v_big
+        params = self.estimator.fit(**kwargs).params_
+
+        # Reshape back to one block of permutations per dataset
+        fe_perm = params["fe_params"].reshape(-1, n_datasets, n_perm)
+        fe_p = (np.abs(fe_stats["est"])[:, :, None] < np.abs(fe_perm)).mean(-1)
+        if rfx:
+            tau_perm = np.asarray(params["tau2"]).ravel()
+            tau_perm = np.broadcast_to(tau_perm, (n_datasets * n_perm,))
+            tau_perm = tau_perm.reshape(n_datasets, n_perm)
+            tau_p = (np.abs(np.asarray(tau2).ravel())[:, None] < np.abs(tau_perm)).mean(-1)
 
         # p-values can't be smaller than 1/n_perm
         params = {"fe_p": np.maximum(1 / n_perm, fe_p)}
@@ -404,22 +474,22 @@ class CombinationTestResults:
         self._p = p
 
     @property
-    @lru_cache(maxsize=1)
     def z(self):
         """Z-values."""
         if self._z is None:
-            self._z = ss.norm.isf(self.p)
+            # -ndtri(p) == ss.norm.isf(p), without the dispatch overhead
+            self._z = -ndtri(self.p)
         return self._z
 
     @property
-    @lru_cache(maxsize=1)
     def p(self):
         """P-values."""
         if self._p is None:
-            self._p = ss.norm.sf(self.z)
+            # ndtr(-z) == ss.norm.sf(z), without the dispatch overhead
+            self._p = ndtr(-self.z)
         return self._p
 
-    def permutation_test(self, n_perm=1000):
+    def permutation_test(self, n_perm=1000, rng=None):
         """Run permutation test.
 
         .. warning::
@@ -433,6 +503,9 @@ class CombinationTestResults:
             Number of permutations to generate. The actual number used may be smaller in the event
             of an exact test (see below), but will never be larger.
             Default = 1000.
+        rng : None, :obj:`int`, or :obj:`numpy.random.Generator`, optional
+            Seed or Generator used to produce the permutations; passed to
+            :func:`numpy.random.default_rng`. Default = None.
 
         Returns
         -------
@@ -452,6 +525,8 @@ class CombinationTestResults:
         if self.dataset is None:
             raise ValueError("The Dataset is unavailable. This method requires a Dataset.")
 
+        rng = np.random.default_rng(rng)
+
         n_obs, n_datasets = self.dataset.y.shape
 
         # create results arrays
@@ -465,6 +540,8 @@ class CombinationTestResults:
             n_perm = n_exact
         else:
             exact = False
+            # Sign flips are dataset-independent, so sample them only once
+            signs = rng.integers(0, 2, size=(n_obs, n_perm), dtype=np.int8) * 2 - 1
 
         # Initialize a copy of the estimator to prevent overwriting results
         est = self.estimator.__class__(mode=self.estimator.mode)
@@ -472,13 +549,7 @@ class CombinationTestResults:
         # Loop over parallel datasets
         for i in range(n_datasets):
             y = self.dataset.y[:, i]
-            y_perm = np.repeat(y[:, None], n_perm, axis=1)
-
-            if exact:
-                y_perm *= perms
-            else:
-                signs = np.random.choice(np.array([-1, 1]), (n_obs, n_perm))
-                y_perm *= signs
+            y_perm = y[:, None] * (perms if exact else signs)
 
             # Some combination tests can handle weights (passed as v)
             kwargs = {"z": y_perm}
@@ -549,12 +620,28 @@ class BayesianMetaRegressionResults:
                 "ArviZ package must be installed in order to work "
                 "with the BayesianMetaRegressionResults class."
             )
-        if data.__class__.__name__ == "StanFit4Model":
-            data = az.from_pystan(data)
-        self.data = data
+        self._raw = data
+        self._data = None
         self.dataset = dataset
         self.ci = ci
 
+    @property
+    def data(self):
+        """Posterior samples, as an ArviZ InferenceData object.
+
+        Converting a raw PyStan fit traverses every draw across all chains
+        and parameters, so the conversion is deferred until first access and
+        cached on the instance.
+        """
+        if self._data is None:
+            data = self._raw
+            if not isinstance(data, az.InferenceData):
+                # Anything else is a raw PyStan fit; from_pystan handles
+                # both the pystan 3 Fit and the legacy StanFit4Model
+                data = az.from_pystan(posterior=data)
+            self._data = data
+        return self._data
+
     def summary(self, include_theta=False, **kwargs):
         """Summarize the posterior estimates via ArviZ.
 
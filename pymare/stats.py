@@ -2,7 +2,6 @@
 
 import numpy as np
 import scipy.stats as ss
-from scipy.optimize import Bounds, minimize
 
 
 def weighted_least_squares(y, v, X, tau2=0.0, return_cov=False):
@@ -61,15 +60,16 @@ def ensure_2d(arr):
     return arr
 
 
-def q_profile(y, v, X, alpha=0.05):
+def q_profile(y, v, X, alpha=0.05, tol=1e-8):
     """Get the CI for tau^2 via the Q-Profile method.
 
     Parameters
     ----------
-    y : :obj:`numpy.ndarray` of shape (K,)
-        1d array of study-level estimates
-    v : :obj:`numpy.ndarray` of shape (K,)
-        1d array of study-level variances
+    y : :obj:`numpy.ndarray` of shape (K,) or (K, d)
+        1d or 2d array of study-level estimates, where d is the number of
+        parallel datasets.
+    v : :obj:`numpy.ndarray` of shape (K,) or (K, d)
+        1d or 2d array of study-level variances
     X : :obj:`numpy.ndarray` of shape (K[, P])
         1d or 2d array containing study-level predictors
         (including intercept); has dimensions K x P, where K is the number
@@ -77,12 +77,17 @@ def q_profile(y, v, X, alpha=0.05):
     alpha : :obj:`float`, optional
         alpha value defining the coverage of the CIs,
         where width(CI) = 1 - alpha. Default = 0.05.
+    tol : :obj:`float`, optional
+        Tolerance on the tau^2 bounds; absolute for bounds near zero and
+        relative for large ones. Default = 1e-8.
 
     Returns
     -------
     :obj:`dict`
         A dictionary with keys 'ci_l' and 'ci_u', corresponding to the lower
         and upper bounds of the tau^2 confidence interval, respectively.
+        Values are floats for single-dataset inputs, and 1d arrays of length
+        d for multi-dataset inputs.
 
     Notes
     -----
@@ -91,26 +96,66 @@ def q_profile(y, v, X, alpha=0.05):
     (i.e., ``P(tau^2 <= lower_bound)  == P(tau^2 >= upper_bound) == alpha/2``),
     and *not* the smallest possible range of tau^2 values that provides the desired coverage.
 
+    The bounds for all parallel datasets are found simultaneously via a
+    vectorized bisection, so no Python-level looping over datasets occurs.
+
     References
     ----------
     .. footbibliography::
     """
+    y = ensure_2d(y)
+    v = ensure_2d(v)
     k, p = X.shape
     df = k - p
     l_crit = ss.chi2.ppf(1 - alpha / 2, df)
     u_crit = ss.chi2.ppf(alpha / 2, df)
-    args = (ensure_2d(y), ensure_2d(v), X)
-    bds = Bounds([0], [np.inf], keep_feasible=True)
+    d = y.shape[1]
 
-    # Use the D-L estimate of tau^2 as a starting point; when using a fixed
-    # value, minimize() sometimes fails to stay in bounds.
+    # Use the D-L estimate of tau^2 to seed the upper bracket; when using a
+    # fixed value, the bracket search may take many doubling steps.
     from .estimators import DerSimonianLaird
 
-    ub_start = 2 * DerSimonianLaird().fit(y, v, X).params_["tau2"]
-
-    lb = minimize(lambda x: (q_gen(*args, x) - l_crit) ** 2, [0], bounds=bds).x[0]
-    ub = minimize(lambda x: (q_gen(*args, x) - u_crit) ** 2, ub_start, bounds=bds).x[0]
-    return {"ci_l": lb, "ci_u": ub}
+    tau_dl = np.atleast_1d(DerSimonianLaird().fit(y, v, X).params_["tau2"]).ravel()
+
+    # Solve Q(tau^2) = crit for both interval bounds at once by stacking the
+    # datasets twice, with the lower-bound targets in the first d columns.
+    yy = np.hstack([y, y])
+    vv = np.hstack([v, v])
+    crit = np.concatenate([np.full(d, l_crit), np.full(d, u_crit)])
+
+    # Q is monotonically decreasing in tau^2, so bounds where Q(0) already
+    # falls below the target are clamped to zero.
+    lo = np.zeros(2 * d)
+    at_zero = q_gen(yy, vv, X, lo) <= crit
+
+    # Expand the upper bracket until Q(hi) has crossed below the target
+    # everywhere, then bisect all columns simultaneously.
+    hi = np.tile(2 * tau_dl, 2) + 1.0
+    for _ in range(1024):
+        high_q = q_gen(yy, vv, X, hi) > crit
+        if not high_q.any():
+            break
+        hi[high_q] *= 2
+
+    # The tolerance is relative for large bounds: an absolute criterion can
+    # never be met once the bracket exceeds the local float64 spacing, where
+    # the midpoint rounds back onto an endpoint. The iteration cap is a
+    # backstop; each halving strips one bit, so 1024 passes exhaust float64.
+    for _ in range(1024):
+        if np.all(hi - lo <= tol * np.maximum(1.0, hi)):
+            break
+        mid = 0.5 * (lo + hi)
+        high_q = q_gen(yy, vv, X, mid) > crit
+        lo = np.where(high_q, mid, lo)
+        hi = np.where(high_q, hi, mid)
+
+    bounds = 0.5 * (lo + hi)
+    bounds[at_zero] = 0.0
+
+    ci_l, ci_u = bounds[:d], bounds[d:]
+    if d == 1:
+        return {"ci_l": float(ci_l[0]), "ci_u": float(ci_u[0])}
+    return {"ci_l": ci_l, "ci_u": ci_u}
 
 
 def q_gen(y, v, X, tau2):
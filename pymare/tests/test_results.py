@@ -129,6 +129,24 @@ def test_mrr_fe_se(results, results_2d):
     assert np.allclose(se_2d[:, 0].T, [2.5656, 0.9538], atol=1e-4)
 
 
+def test_mrr_fe_se_2d_intercept_only(small_dataset_2d):
+    """Test fe_se for intercept-only fits to 2D data.
+
+    The loopable likelihood estimators produce a 2-d (1, d) fe_cov with one
+    variance per dataset. This is a regression test for a bug that collapsed
+    those to the first dataset's standard error.
+    """
+    est = VarianceBasedLikelihoodEstimator()
+    se_2d = est.fit_dataset(small_dataset_2d).summary().fe_se
+    assert se_2d.shape == (1, 2)
+
+    # Each dataset's SE must match the corresponding single-dataset fit
+    for i in range(2):
+        dataset_i = Dataset(small_dataset_2d.y[:, i], small_dataset_2d.v[:, i])
+        se_i = est.fit_dataset(dataset_i).summary().fe_se
+        assert np.allclose(se_2d[:, i], se_i.ravel())
+
+
 def test_mrr_get_fe_stats(results):
     """Test MetaRegressionResults.get_fe_stats."""
     stats = results.get_fe_stats()
@@ -147,7 +165,7 @@ def test_mrr_get_re_stats(results_2d):
     assert stats["ci_u"].shape == (3,)
     assert round(stats["tau^2"][0, 2], 4) == 7.7649
     assert round(stats["ci_l"][2], 4) == 3.8076
-    assert round(stats["ci_u"][2], 2) == 59.61
+    assert round(stats["ci_u"][2], 2) == 59.62
 
 
 def test_mrr_get_heterogeneity_stats(results_2d):
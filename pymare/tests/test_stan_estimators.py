@@ -18,15 +18,31 @@ def test_stan_estimator(dataset):
     beta1, beta2, tau2 = summary["mean"].values[:3]
     assert -0.5 < beta1 < 0.1
     assert 0.6 < beta2 < 0.9
-    assert 3 < tau2 < 5
+    # tau2 is a true variance (square of the sampled sd); the old model
+    # misused the tau2 parameter as the sd in theta ~ normal(0, tau2)
+    assert 7 < tau2 < 25
 
 
 @pytest.mark.skipif(sys.version_info < (3, 7), reason="requires python 3.7 or higher")
-def test_stan_2d_input_failure(dataset_2d):
-    """Run smoke test for StanMetaRegression on 2D data."""
+def test_stan_estimator_2d(dataset_2d):
+    """Run smoke test for StanMetaRegression on 2D (parallel) data."""
+    est = StanMetaRegression(num_samples=500).fit_dataset(dataset_2d)
+    results = est.summary()
+    assert "BayesianMetaRegressionResults" == results.__class__.__name__
+    summary = results.summary(var_names=["beta", "tau2"])
+    # one beta per predictor per dataset, plus one tau2 per dataset
+    n_datasets = dataset_2d.y.shape[1]
+    assert summary["mean"].shape[0] == 3 * n_datasets
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="requires python 3.7 or higher")
+def test_stan_2d_groups_failure(dataset_2d):
+    """Ensure groups are rejected when fitting parallel datasets."""
     with pytest.raises(ValueError) as exc:
-        StanMetaRegression(num_samples=500).fit_dataset(dataset_2d)
-    assert str(exc.value).startswith("The StanMetaRegression")
+        StanMetaRegression(num_samples=500).fit(
+            dataset_2d.y, dataset_2d.v, dataset_2d.X, groups=list(range(1, 9))
+        )
+    assert str(exc.value).startswith("The groups argument")
 
 
 def test_stan_python_36_failure(dataset):
@@ -14,7 +14,21 @@ def test_q_profile(vars_with_intercept):
     bounds = stats.q_profile(*vars_with_intercept, 0.05)
     assert set(bounds.keys()) == {"ci_l", "ci_u"}
     assert round(bounds["ci_l"], 4) == 3.8076
-    assert round(bounds["ci_u"], 2) == 59.61
+    assert round(bounds["ci_u"], 2) == 59.62
+
+
+def test_q_profile_large_scale(vars_with_intercept):
+    """Test pymare.stats.q_profile on data with very large tau^2 values.
+
+    This is a regression test for a hang in the bisection: with an absolute
+    tolerance, the loop could never converge once the bracket exceeded the
+    local float64 spacing. The bounds must also match the base fixture's,
+    scaled by the variance rescaling factor.
+    """
+    y, v, X = vars_with_intercept
+    bounds = stats.q_profile(y * 1e6, v * 1e12, X, 0.05)
+    assert round(bounds["ci_l"] / 1e12, 4) == 3.8076
+    assert round(bounds["ci_u"] / 1e12, 2) == 59.62
 
 
 def test_var_to_ci():